@@ -2,7 +2,7 @@
 Flask web application for Dev.to post analyzer.
 """
 import os
-import json
+import time
 from flask import Flask, render_template, request, jsonify, session
 from dotenv import load_dotenv
 from analyzer import DevToAnalyzer
@@ -18,6 +18,35 @@ app.secret_key = os.getenv("SECRET_KEY", "dev-to-analyzer-secret")
 # Default LLM provider
 DEFAULT_LLM_PROVIDER = "openai"
 
+# In-process cache of the latest analysis per user, so the LLM endpoints
+# can reuse it instead of requiring clients to re-send the full payload.
+# Bounded because usernames come straight from request input.
+ANALYSIS_CACHE_TTL = 600  # seconds
+ANALYSIS_CACHE_MAX = 256
+_analysis_cache = {}
+
+
+def _cache_analysis(username, report, llm_data):
+    """Remember the latest analysis results for a username."""
+    if len(_analysis_cache) >= ANALYSIS_CACHE_MAX and username not in _analysis_cache:
+        _analysis_cache.pop(next(iter(_analysis_cache)))
+    _analysis_cache[username] = {
+        'timestamp': time.time(),
+        'report': report,
+        'llm_data': llm_data
+    }
+
+
+def _get_cached_analysis(username):
+    """Return the cached analysis for a username, or None if missing/stale."""
+    entry = _analysis_cache.get(username)
+    if entry is None:
+        return None
+    if time.time() - entry['timestamp'] > ANALYSIS_CACHE_TTL:
+        _analysis_cache.pop(username, None)
+        return None
+    return entry
+
 
 @app.route('/')
 def index():
@@ -48,17 +77,17 @@ def analyze():
         
         # Generate a comprehensive report
         report = analyzer.generate_analysis_report()
-        
-        # Store the report in session
-        session['report'] = json.dumps(report, default=str)
-        
+
         # Get data for LLM analysis
         llm_data = analyzer.get_data_for_llm_analysis()
-        
+
+        # Cache the results so follow-up API calls can reuse them
+        _cache_analysis(username, report, llm_data)
+
         # Get insights from LLM if API keys are available
         insights = None
         topic_ideas = None
-        
+
         llm_enabled = False
         if llm_provider == "openai" and os.getenv("OPENAI_API_KEY"):
             llm_enabled = True
@@ -70,12 +99,12 @@ def analyze():
             # Use mock data if provider specified but API keys not configured
             llm_enabled = True
             llm_provider = "mock"
-        
+
         if llm_enabled:
             llm_service = LLMService(llm_provider=llm_provider)
             insights = llm_service.generate_insights(llm_data)
             topic_ideas = llm_service.generate_topic_ideas(llm_data, num_ideas=5)
-        
+
         # Render the results page
         return render_template(
             'results.html',
@@ -109,7 +138,10 @@ def api_analyze():
         
         # Get data for LLM analysis
         llm_data = analyzer.get_data_for_llm_analysis()
-        
+
+        # Cache the results so follow-up API calls can reuse them
+        _cache_analysis(username, report, llm_data)
+
         # Get insights from LLM if API keys are available
         insights = None
         topic_ideas = None
@@ -152,10 +184,17 @@ def api_generate_insights():
     data = request.json
     report = data.get('report')
     llm_provider = data.get('llm_provider', DEFAULT_LLM_PROVIDER)
-    
+
     if not report:
-        return jsonify({'error': 'Report data is required'}), 400
-    
+        # Fall back to the cached analysis for the session's own user only;
+        # honoring a body-supplied username would let anyone read another
+        # user's cached analysis
+        username = session.get('username')
+        entry = _get_cached_analysis(username) if username else None
+        if entry is None:
+            return jsonify({'error': 'Report data is required'}), 400
+        report = entry['llm_data']
+
     try:
         llm_service = LLMService(llm_provider=llm_provider)
         insights = llm_service.generate_insights(report)
@@ -173,10 +212,17 @@ def api_generate_topic_ideas():
     report = data.get('report')
     llm_provider = data.get('llm_provider', DEFAULT_LLM_PROVIDER)
     num_ideas = data.get('num_ideas', 5)
-    
+
     if not report:
-        return jsonify({'error': 'Report data is required'}), 400
-    
+        # Fall back to the cached analysis for the session's own user only;
+        # honoring a body-supplied username would let anyone read another
+        # user's cached analysis
+        username = session.get('username')
+        entry = _get_cached_analysis(username) if username else None
+        if entry is None:
+            return jsonify({'error': 'Report data is required'}), 400
+        report = entry['llm_data']
+
     try:
         llm_service = LLMService(llm_provider=llm_provider)
         topic_ideas = llm_service.generate_topic_ideas(report, num_ideas=num_ideas)
@@ -1,72 +1,140 @@
 """
 LLM service for analyzing dev.to post data and generating insights.
 """
-import os
+import functools
+import hashlib
+import heapq
 import json
-from typing import Dict, Any, Optional, List
+import random
+import re
+import time
+from collections import defaultdict
+from itertools import islice
+from typing import Dict, Any, List, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class LLMService:
-    """
-    Service for interacting with LLMs (OpenAI or Groq) to generate insights.
+
+def _dump_json(data: Any) -> str:
+    """Serialize data for embedding in a prompt, preferring orjson.
+
+    Keys are sorted so identical data always yields identical prompt
+    bytes, which both response caching and provider prompt caching rely on.
+    Output is compact: indentation roughly triples the token count of the
+    data block for no gain in model comprehension.
     """
-    
-    def __init__(self, llm_provider: str = "openai"):
-        """
-        Initialize the LLM service.
-        
-        Args:
-            llm_provider: The LLM provider to use ('openai' or 'groq')
-        """
-        self.llm_provider = llm_provider.lower()
-        
-        # For now we'll use a mock implementation to avoid API dependencies
-        self.use_mock = True
-        
-    def generate_insights(self, analysis_data: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Generate insights from the analysis data.
-        
-        Args:
-            analysis_data: Dictionary containing post analysis data
-            
-        Returns:
-            Dictionary with generated insights
-        """
-        if self.use_mock:
-            return self._get_mock_insights(analysis_data)
-        
-        # In a real implementation, would call the LLM API here
-        return {}
-    
-    def generate_topic_ideas(self, analysis_data: Dict[str, Any], num_ideas: int = 5) -> List[Dict[str, Any]]:
-        """
-        Generate topic ideas based on analysis data.
-        
-        Args:
-            analysis_data: Dictionary containing post analysis data
-            num_ideas: Number of topic ideas to generate
-            
-        Returns:
-            List of topic idea dictionaries
-        """
-        if self.use_mock:
-            return self._get_mock_topic_ideas(analysis_data, num_ideas)
-        
-        # In a real implementation, would call the LLM API here
-        return []
-    
-    def _create_insight_prompt(self, analysis_data: Dict[str, Any]) -> str:
-        """
-        Create a prompt for generating insights.
-        
-        Args:
-            analysis_data: Dictionary containing post analysis data
-            
-        Returns:
-            Formatted prompt string
-        """
-        prompt = """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS, default=str).decode('utf-8')
+    return json.dumps(data, separators=(',', ':'), sort_keys=True, default=str)
+
+
+# Title templates per content type; only the randomly chosen one is formatted
+_TITLE_PATTERNS = {
+    'tutorial': (
+        "Building {t0} Applications: A Step-by-Step Guide",
+        "How to Master {t0} Development",
+        "Practical {t0} Tips for Real-World Projects"
+    ),
+    'best-practices': (
+        "{t0} Best Practices for Professional Developers",
+        "Writing Better {t0} Code: Tips and Tricks",
+        "Advanced {t0} Patterns You Should Know"
+    ),
+    'deep-dive': (
+        "Deep Dive: Advanced {t0} Concepts",
+        "Understanding {t0} Internals",
+        "Advanced {t0} Architecture Patterns"
+    )
+}
+
+
+# Splits comma-separated tag strings and swallows surrounding whitespace
+_TAG_SPLIT = re.compile(r'\s*,\s*')
+
+
+def _split_tags(raw: Any) -> List[str]:
+    """Split a post's tags field (comma string or list) into clean tag names."""
+    if isinstance(raw, str):
+        return [part for part in _TAG_SPLIT.split(raw.strip()) if part]
+    return [tag.strip() for tag in (raw or []) if tag.strip()]
+
+
+# Common tags that should be in specific case
+_SPECIAL_CASES = {
+    'javascript': 'JavaScript',
+    'typescript': 'TypeScript',
+    'nodejs': 'Node.js',
+    'nextjs': 'Next.js',
+    'reactjs': 'React.js',
+    'vuejs': 'Vue.js',
+    'aws': 'AWS',
+    'dotnet': '.NET',
+    'csharp': 'C#',
+    'cpp': 'C++',
+    'devops': 'DevOps',
+    'ai': 'AI',
+    'ml': 'ML',
+    'api': 'API',
+    'graphql': 'GraphQL',
+    'postgresql': 'PostgreSQL',
+    'mysql': 'MySQL',
+    'nosql': 'NoSQL',
+    'mongodb': 'MongoDB',
+    'php': 'PHP',
+    'css': 'CSS',
+    'html': 'HTML',
+    'sass': 'Sass',
+    'scss': 'SCSS',
+    'ios': 'iOS',
+    'macos': 'macOS',
+    'linux': 'Linux',
+    'windows': 'Windows',
+    'ci': 'CI',
+    'cd': 'CD',
+    'cicd': 'CI/CD',
+    'iot': 'IoT',
+    'ui': 'UI',
+    'ux': 'UX',
+    'jwt': 'JWT',
+    'oauth': 'OAuth',
+    'regex': 'RegEx',
+    'webdev': 'WebDev',
+    'seo': 'SEO'
+}
+
+
+@functools.lru_cache(maxsize=2048)
+def _normalize_tag_cached(tag: str) -> str:
+    """Normalization behind LLMService._normalize_tag, cached per tag string."""
+    # Return special case if it exists
+    special = _SPECIAL_CASES.get(tag.lower())
+    if special is not None:
+        return special
+
+    # For compound tags with hyphens, capitalize each part; title() does the
+    # split-capitalize-join in one C-level pass with hyphens as boundaries
+    if '-' in tag:
+        return tag.title()
+
+    # Default to capitalizing the first letter
+    return tag.capitalize()
+
+
+# Cache of generated responses keyed by a digest of the analysis data.
+# Shared across instances because the web layer builds a fresh LLMService
+# per request; repeated dashboard refreshes with unchanged data become a
+# dict lookup instead of a full generation pass (or LLM call).
+_RESPONSE_CACHE: Dict[Any, Any] = {}
+_RESPONSE_CACHE_MAX = 512
+_RESPONSE_CACHE_TTL = 3600  # seconds
+
+# Static system prompts kept as module constants so they are byte-identical
+# on every call and eligible for provider-side prompt caching; everything
+# request-specific goes into the user message instead.
+_INSIGHT_SYSTEM_PROMPT = """
 You are an expert content strategist analyzing performance data from dev.to blog posts.
 I'll provide you with analysis data for a user's posts, and I need you to generate insights and recommendations.
 
@@ -102,30 +170,15 @@ Return your analysis in a structured JSON format like this:
     "series_strategy": "Advice on creating and managing series of posts...",
     "engagement_boosters": "Specific tactics to increase reader engagement..."
 }
-
-Analysis data:
 """
-        prompt += json.dumps(analysis_data, indent=2)
-        return prompt
-    
-    def _create_topic_ideas_prompt(self, analysis_data: Dict[str, Any], num_ideas: int) -> str:
-        """
-        Create a prompt for generating topic ideas.
-        
-        Args:
-            analysis_data: Dictionary containing post analysis data
-            num_ideas: Number of topic ideas to generate
-            
-        Returns:
-            Formatted prompt string
-        """
-        prompt = f"""
+
+_TOPIC_IDEAS_SYSTEM_PROMPT = """
 You are an expert technical content creator who helps developers come up with engaging blog post ideas.
-I'll provide you with analysis data for a user's dev.to posts, and I need you to generate {num_ideas} specific topic ideas 
-that are likely to perform well based on their historical performance.
+I'll provide you with analysis data for a user's dev.to posts, and I need you to generate the requested number
+of specific topic ideas that are likely to perform well based on their historical performance.
 
 Focus on the following insights from their data:
-- Their top performing tags: {", ".join([tag.get('tag', '') for tag in analysis_data.get('top_tags', [])][:5])}
+- Their top performing tags
 - Their highest engagement content types
 - Any tag recommendations provided in the data
 - Series performance (if they publish content in series)
@@ -141,64 +194,373 @@ For each topic idea, provide:
 
 Return your ideas in a structured JSON array like this:
 [
-    {{
+    {
         "title": "Catchy Topic Title",
         "description": "Brief description of the post idea...",
         "suggested_tags": ["tag1", "tag2", "tag3"],
         "estimated_reading_time": 7,
         "performance_rationale": "Why this topic should perform well based on their data...",
         "series_potential": "Standalone post" or "Would work well as a 3-part series on [topic]"
-    }},
+    },
     ...
 ]
 
 Make sure the ideas are specific, actionable, and tailored to the user's niche and audience.
 Prioritize ideas that align with their top-performing content and tag recommendations.
-
-Analysis data:
 """
-        prompt += json.dumps(analysis_data, indent=2)
-        return prompt
+
+# Subset of analysis_data that determines the generated output.
+_CACHE_FIELDS = (
+    'username', 'top_tags', 'best_days', 'best_hours',
+    'series_performance', 'tag_recommendations', 'highest_engagement_posts'
+)
+
+# Skeleton of the mock insight payload, built once at module load. String
+# leaves are format_map templates; a leaf that is exactly one placeholder
+# (e.g. "{best_days}") is replaced wholesale so lists survive substitution.
+_INSIGHT_TEMPLATE = {
+    "performance_summary": "Your dev.to blog posts show good engagement with healthy reaction and comment rates. Your content in the {top_tags_joined} tags performs particularly well. Your posts with practical, solution-oriented content receive higher engagement than more theoretical pieces.",
+
+    "key_patterns": [
+        "Tutorial-style posts with specific code examples typically get 40% more engagement",
+        "Posts with 5-10 minute reading times perform better than both shorter and longer content",
+        "Articles published on {best_days_joined} receive more reactions and comments",
+        "Content tagged with '{top_tags_joined}' consistently attracts more readers",
+        "Posts that include diagrams or visual elements get 30% more reactions"
+    ],
+
+    "content_recommendations": [
+        "Create more step-by-step tutorials with practical code examples",
+        "Break complex topics into series of 5-8 minute reading time posts",
+        "Include diagrams or visualizations to improve engagement on conceptual topics",
+        "End posts with a clear call-to-action like a question to increase comment rates",
+        "Add a personal perspective to technical content to differentiate your writing",
+        "Use the tag combination '{tag_combo}' for highest visibility"
+    ],
+
+    "optimal_posting_strategy": {
+        "best_days": "{best_days}",
+        "best_hours": "{best_hours}",
+        "recommended_tags": "{recommended_tags}",
+        "content_type": "In-depth tutorials with practical code examples and clear explanations of technical concepts",
+        "style_tips": "Aim for 5-8 minute reading time, use headings to break up content, include code samples, and end with thought-provoking questions to encourage comments"
+    },
+
+    "series_strategy": "{series_strategy}",
+
+    "engagement_boosters": "Respond quickly to comments on your posts to foster community. Share your posts on Twitter and LinkedIn with thoughtful commentary. Consider cross-posting popular content to your personal blog with canonical URLs pointing to dev.to. Ask engaging questions at the end of your posts to encourage discussion."
+}
+
+
+def _render_template(node: Any, ctx: Dict[str, Any]) -> Any:
+    """Recursively substitute ctx values into a template skeleton."""
+    if isinstance(node, str):
+        if node.startswith('{') and node.endswith('}') and node[1:-1] in ctx:
+            # Whole-value placeholder: keep the context value's own type
+            return ctx[node[1:-1]]
+        return node.format_map(ctx)
+    if isinstance(node, list):
+        return [_render_template(item, ctx) for item in node]
+    if isinstance(node, dict):
+        return {key: _render_template(value, ctx) for key, value in node.items()}
+    return node
+
+
+# Topic-idea templates expanded in a single pass by _get_mock_topic_ideas.
+# 'requires' gates each idea on how many top tags are available ('combo'
+# means a successful tag combination must exist). Tag entries named 'top0',
+# 'top1' or '+combo' resolve from the per-request context; anything else is
+# a literal tag. String fields are format_map templates over that context.
+_IDEA_TEMPLATES = (
+    {
+        'pattern': 'tutorial',
+        'requires': 2,
+        'title_tags': ('top0', 'top1'),
+        'description': "A comprehensive guide combining {top0} and {top1} to build production-ready applications. Learn best practices, optimization techniques, and real-world implementation patterns.",
+        'suggested_tags': ('top0', 'top1', _normalize_tag_cached('tutorial'), _normalize_tag_cached('programming')),
+        'reading_time': 8,
+        'rationale': "Combines your two best-performing tags ({top0}, {top1}) which have an average of {top0_reactions:.1f} reactions per post.",
+        'series': "Would work well as a 3-part series"
+    },
+    {
+        'pattern': 'best-practices',
+        'requires': 1,
+        'title_tags': ('top0',),
+        'description': "Learn from real-world experience about common pitfalls in {top0} development. Includes code examples, performance tips, and maintainability guidelines.",
+        'suggested_tags': ('top0', _normalize_tag_cached('bestpractices'), _normalize_tag_cached('programming'), _normalize_tag_cached('debugging')),
+        'reading_time': 7,
+        'rationale': "Your content in {top0} consistently performs well with {top0_reactions:.1f} average reactions.",
+        'series': None
+    },
+    {
+        'pattern': 'tutorial',
+        'requires': 'combo',
+        'title_tags': ('+combo',),
+        'description': "Learn how to integrate {combo0} with {combo1} to create robust applications. Based on real-world best practices and performance optimization techniques.",
+        'suggested_tags': ('+combo', _normalize_tag_cached('tutorial'), _normalize_tag_cached('webdev')),
+        'reading_time': 9,
+        'rationale': "This tag combination has historically performed very well, with {combo_engagement:.3f} engagement ratio across {combo_count} posts.",
+        'series': "Would work well as a 4-part series"
+    },
+    {
+        'pattern': 'best-practices',
+        'requires': 1,
+        'title_tags': ('top0', 'testing'),
+        'description': "A comprehensive guide to testing {top0} applications. Covers unit testing, integration testing, and setting up CI/CD pipelines.",
+        'suggested_tags': ('top0', _normalize_tag_cached('testing'), _normalize_tag_cached('automation'), _normalize_tag_cached('devops')),
+        'reading_time': 8,
+        'rationale': "Content about {top0} combined with testing/automation typically drives high engagement.",
+        'series': "Would work well as a 3-part testing series"
+    },
+    {
+        'pattern': 'deep-dive',
+        'requires': 2,
+        'title_tags': ('top0', 'top1'),
+        'description': "Deep dive into performance optimization for applications using {top0} and {top1}. Includes benchmarking, profiling, and practical optimization techniques.",
+        'suggested_tags': ('top0', 'top1', _normalize_tag_cached('performance'), _normalize_tag_cached('optimization')),
+        'reading_time': 7,
+        'rationale': "Performance-focused content using your top tags ({top0}, {top1}) consistently drives high engagement.",
+        'series': "Would work well as a performance optimization series"
+    },
+    {
+        'pattern': 'best-practices',
+        'requires': 1,
+        'title_tags': ('top0', 'security'),
+        'description': "Essential security considerations and implementation techniques for {top0} applications. Covers common vulnerabilities, security testing, and secure coding practices.",
+        'suggested_tags': ('top0', _normalize_tag_cached('security'), _normalize_tag_cached('webdev'), _normalize_tag_cached('bestpractices')),
+        'reading_time': 8,
+        'rationale': "Security topics consistently perform well across technical audiences, especially when combined with specific technology implementations.",
+        'series': "Would work well as a security series"
+    },
+    {
+        'pattern': 'deep-dive',
+        'requires': 2,
+        'title_tags': ('top0', 'top1'),
+        'description': "Explore modern software architecture patterns using {top0} and {top1}. Learn about microservices, serverless, and scalable architectures.",
+        'suggested_tags': ('top0', 'top1', _normalize_tag_cached('architecture'), _normalize_tag_cached('design-patterns')),
+        'reading_time': 9,
+        'rationale': "Architecture-focused content tends to drive high engagement, especially when combined with practical implementation using top-performing technologies.",
+        'series': "Would work well as a 5-part architecture series"
+    }
+)
+
+# series_potential per template for each has_series case, resolved at import
+# so the render loop just indexes into the right tuple
+_SERIES_POTENTIALS = tuple(template['series'] or "Standalone post" for template in _IDEA_TEMPLATES)
+_STANDALONE_POTENTIALS = ("Standalone post",) * len(_IDEA_TEMPLATES)
+
+
+class LLMService:
+    """
+    Service for interacting with LLMs (OpenAI or Groq) to generate insights.
+    """
     
-    def _generate_title(self, pattern: str, tags: List[str], analysis_data: Dict[str, Any]) -> str:
+    def __init__(self, llm_provider: str = "openai"):
         """
-        Generate a dynamic title based on pattern and user's data.
+        Initialize the LLM service.
         
+        Args:
+            llm_provider: The LLM provider to use ('openai' or 'groq')
+        """
+        self.llm_provider = llm_provider.lower()
+
+        # For now we'll use a mock implementation to avoid API dependencies
+        self.use_mock = True
+
+        # Resolve the generation implementation once at construction rather
+        # than branching on use_mock inside every call
+        if self.use_mock:
+            self._insights_impl = self._get_mock_insights
+            self._topic_ideas_impl = self._get_mock_topic_ideas
+        else:
+            self._insights_impl = self._real_generate_insights
+            self._topic_ideas_impl = self._real_generate_topic_ideas
+
+    def _real_generate_insights(self, analysis_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Provider-backed insight generation; not implemented yet."""
+        # In a real implementation, would call the LLM API here
+        return {}
+
+    def _real_generate_topic_ideas(self, analysis_data: Dict[str, Any], num_ideas: int) -> List[Dict[str, Any]]:
+        """Provider-backed topic-idea generation; not implemented yet."""
+        # In a real implementation, would call the LLM API here
+        return []
+
+    def generate_insights(self, analysis_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Generate insights from the analysis data.
+        
+        Args:
+            analysis_data: Dictionary containing post analysis data
+            
+        Returns:
+            Dictionary with generated insights
+        """
+        cache_key = ('insights', self.llm_provider, self._cache_digest(analysis_data))
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
+
+        insights = self._insights_impl(analysis_data)
+        self._cache_response(cache_key, insights)
+        return insights
+
+    def generate_insights_json(self, analysis_data: Dict[str, Any]) -> bytes:
+        """
+        Generate insights serialized as a UTF-8 JSON blob.
+
+        Lets callers that only forward the result over HTTP skip their own
+        serialization pass; the underlying response cache still applies.
+
+        Args:
+            analysis_data: Dictionary containing post analysis data
+
+        Returns:
+            JSON-encoded insights as bytes
+        """
+        insights = self.generate_insights(analysis_data)
+        if orjson is not None:
+            return orjson.dumps(insights)
+        return json.dumps(insights).encode('utf-8')
+    
+    def generate_topic_ideas(self, analysis_data: Dict[str, Any], num_ideas: int = 5) -> List[Dict[str, Any]]:
+        """
+        Generate topic ideas based on analysis data.
+        
+        Args:
+            analysis_data: Dictionary containing post analysis data
+            num_ideas: Number of topic ideas to generate
+            
+        Returns:
+            List of topic idea dictionaries
+        """
+        cache_key = ('topic_ideas', self.llm_provider, num_ideas, self._cache_digest(analysis_data))
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
+
+        ideas = self._topic_ideas_impl(analysis_data, num_ideas)
+        self._cache_response(cache_key, ideas)
+        return ideas
+
+    @staticmethod
+    def _cache_digest(analysis_data: Dict[str, Any]) -> str:
+        """
+        Build a stable digest of the analysis fields that drive generation.
+
+        Args:
+            analysis_data: Dictionary containing post analysis data
+
+        Returns:
+            Hex digest string usable as a cache key component
+        """
+        subset = {k: analysis_data[k] for k in _CACHE_FIELDS if k in analysis_data}
+        payload = json.dumps(subset, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    @staticmethod
+    def _cache_response(cache_key: Any, response: Any) -> None:
+        """
+        Store a generated response, evicting the oldest entry when full.
+
+        Args:
+            cache_key: Key identifying the request
+            response: The generated response to remember
+        """
+        if len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAX:
+            _RESPONSE_CACHE.pop(next(iter(_RESPONSE_CACHE)))
+        _RESPONSE_CACHE[cache_key] = (time.time(), response)
+
+    @staticmethod
+    def _cached_response(cache_key: Any) -> Any:
+        """
+        Fetch a cached response, dropping it when older than the TTL.
+
+        Args:
+            cache_key: Key identifying the request
+
+        Returns:
+            The cached response, or None on miss/expiry
+        """
+        entry = _RESPONSE_CACHE.get(cache_key)
+        if entry is None:
+            return None
+        timestamp, response = entry
+        if time.time() - timestamp > _RESPONSE_CACHE_TTL:
+            _RESPONSE_CACHE.pop(cache_key, None)
+            return None
+        return response
+
+    def _create_insight_prompt(self, analysis_data: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        Create the prompt pair for generating insights.
+
+        Args:
+            analysis_data: Dictionary containing post analysis data
+
+        Returns:
+            (system message, user message) pair; the system half is a module
+            constant so provider-side prompt caching can reuse it verbatim
+        """
+        return _INSIGHT_SYSTEM_PROMPT, "Analysis data:\n" + _dump_json(analysis_data)
+
+    def _create_topic_ideas_prompt(self, analysis_data: Dict[str, Any], num_ideas: int) -> Tuple[str, str]:
+        """
+        Create the prompt pair for generating topic ideas.
+
+        Args:
+            analysis_data: Dictionary containing post analysis data
+            num_ideas: Number of topic ideas to generate
+
+        Returns:
+            (system message, user message) pair; everything request-specific
+            (num_ideas, top tags, analysis data) lives in the user half
+        """
+        top_tags = ", ".join([tag.get('tag', '') for tag in analysis_data.get('top_tags', [])][:5])
+        user_msg = (
+            f"Generate {num_ideas} topic ideas.\n"
+            f"Their top performing tags: {top_tags}\n\n"
+            "Analysis data:\n" + _dump_json(analysis_data)
+        )
+        return _TOPIC_IDEAS_SYSTEM_PROMPT, user_msg
+    
+    def _create_title_prompt(self, pattern: str, tags: List[str], analysis_data: Dict[str, Any]) -> str:
+        """
+        Create a title-generation prompt seeded with successful post titles.
+
         Args:
             pattern: The type of content (tutorial, guide, best-practices, etc)
             tags: List of tags to incorporate
             analysis_data: Dictionary containing post analysis data
-            
+
         Returns:
-            A dynamically generated title
+            Formatted prompt string
         """
-        # Create a prompt for title generation based on successful posts
         high_engagement_posts = analysis_data.get('highest_engagement_posts', [])
-        
+
         # Extract titles and engagement metrics from successful posts
+        target_tags = {tag.lower() for tag in tags}
         successful_titles = []
         for post in high_engagement_posts:
-            post_tags = post.get('tags', '').split(',') if isinstance(post.get('tags'), str) else post.get('tags', [])
-            post_tags = [tag.strip().lower() for tag in post_tags if tag.strip()]
-            
+            post_tags = [tag.lower() for tag in _split_tags(post.get('tags'))]
+
             # Check if the post uses any of our target tags
-            if any(tag.lower() in post_tags for tag in tags):
+            if target_tags.intersection(post_tags):
                 successful_titles.append({
                     'title': post.get('title', ''),
                     'engagement': post.get('engagement_ratio', 0),
                     'tags': post_tags
                 })
-        
+
         # Sort by engagement to prioritize most successful titles
         successful_titles.sort(key=lambda x: x['engagement'], reverse=True)
-        
-        # Create prompt for LLM with context about successful titles and desired focus
-        prompt = f"""
+
+        return f"""
 Based on the following successful blog post titles and their engagement metrics,
 generate a title for a new {pattern} post about {', '.join(tags)}.
 
 Successful titles for reference:
-{json.dumps(successful_titles[:5], indent=2)}
+{_dump_json(successful_titles[:5])}
 
 Content type: {pattern}
 Primary tags: {', '.join(tags)}
@@ -210,33 +572,28 @@ The title should:
 4. Be appropriate for a {pattern} post
 5. Be engaging and professional
 """
+
+    def _generate_title(self, pattern: str, tags: List[str], analysis_data: Dict[str, Any]) -> str:
+        """
+        Generate a dynamic title based on pattern and user's data.
         
-        # For mock implementation, generate a contextual title
-        import random
-        
-        # Extract common patterns from successful titles
-        patterns = {
-            'tutorial': [
-                f"Building {tags[0]} Applications: A Step-by-Step Guide",
-                f"How to Master {tags[0]} Development",
-                f"Practical {tags[0]} Tips for Real-World Projects"
-            ],
-            'best-practices': [
-                f"{tags[0]} Best Practices for Professional Developers",
-                f"Writing Better {tags[0]} Code: Tips and Tricks",
-                f"Advanced {tags[0]} Patterns You Should Know"
-            ],
-            'deep-dive': [
-                f"Deep Dive: Advanced {tags[0]} Concepts",
-                f"Understanding {tags[0]} Internals",
-                f"Advanced {tags[0]} Architecture Patterns"
-            ]
-        }
-        
+        Args:
+            pattern: The type of content (tutorial, guide, best-practices, etc)
+            tags: List of tags to incorporate
+            analysis_data: Dictionary containing post analysis data
+            
+        Returns:
+            A dynamically generated title
+        """
+        if not self.use_mock:
+            # The successful-titles scan and prompt only matter for a real
+            # LLM call, so the mock path skips the per-title O(posts) pass
+            prompt = self._create_title_prompt(pattern, tags, analysis_data)
+
         # In a real implementation, this would call the LLM API
         # For now, use patterns based on content type and successful titles
-        title_patterns = patterns.get(pattern, patterns['tutorial'])
-        chosen_title = random.choice(title_patterns)
+        title_patterns = _TITLE_PATTERNS.get(pattern, _TITLE_PATTERNS['tutorial'])
+        chosen_title = random.choice(title_patterns).format(t0=tags[0])
         
         # If we have multiple tags, try to incorporate them
         if len(tags) > 1:
@@ -255,62 +612,7 @@ The title should:
         Returns:
             Normalized tag string
         """
-        # Common tags that should be in specific case
-        special_cases = {
-            'javascript': 'JavaScript',
-            'typescript': 'TypeScript',
-            'nodejs': 'Node.js',
-            'nextjs': 'Next.js',
-            'reactjs': 'React.js',
-            'vuejs': 'Vue.js',
-            'aws': 'AWS',
-            'dotnet': '.NET',
-            'csharp': 'C#',
-            'cpp': 'C++',
-            'devops': 'DevOps',
-            'ai': 'AI',
-            'ml': 'ML',
-            'api': 'API',
-            'graphql': 'GraphQL',
-            'postgresql': 'PostgreSQL',
-            'mysql': 'MySQL',
-            'nosql': 'NoSQL',
-            'mongodb': 'MongoDB',
-            'php': 'PHP',
-            'css': 'CSS',
-            'html': 'HTML',
-            'sass': 'Sass',
-            'scss': 'SCSS',
-            'ios': 'iOS',
-            'macos': 'macOS',
-            'linux': 'Linux',
-            'windows': 'Windows',
-            'ci': 'CI',
-            'cd': 'CD',
-            'cicd': 'CI/CD',
-            'iot': 'IoT',
-            'ui': 'UI',
-            'ux': 'UX',
-            'jwt': 'JWT',
-            'oauth': 'OAuth',
-            'regex': 'RegEx',
-            'webdev': 'WebDev',
-            'seo': 'SEO'
-        }
-        
-        # Convert to lowercase for comparison
-        tag_lower = tag.lower()
-        
-        # Return special case if it exists
-        if tag_lower in special_cases:
-            return special_cases[tag_lower]
-        
-        # For compound tags with hyphens, capitalize each part
-        if '-' in tag:
-            return '-'.join(word.capitalize() for word in tag.split('-'))
-        
-        # Default to capitalizing the first letter
-        return tag.capitalize()
+        return _normalize_tag_cached(tag)
 
     def _get_mock_insights(self, analysis_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -322,68 +624,40 @@ The title should:
         Returns:
             Dictionary with mock insights
         """
-        username = analysis_data.get('username', '')
-        top_tags = [tag['tag'] for tag in analysis_data.get('top_tags', [])[:3]] if 'top_tags' in analysis_data and len(analysis_data['top_tags']) > 0 else ["javascript", "webdev", "programming"]
+        top_tags = [tag['tag'] for tag in islice(analysis_data.get('top_tags') or (), 3)] or ["javascript", "webdev", "programming"]
         
         # Get series data if available
-        series_strategy = "Consider creating more series content to engage your audience more deeply. Series posts tend to build reader loyalty and encourage return visits."
-        if 'series_performance' in analysis_data and analysis_data['series_performance']:
-            if len(analysis_data['series_performance']) > 0:
-                series_strategy = "Your series content is performing well. Continue creating series posts for complex topics, ideally keeping them to 3-5 parts for optimal completion rates."
-        
+        if analysis_data.get('series_performance'):
+            series_strategy = "Your series content is performing well. Continue creating series posts for complex topics, ideally keeping them to 3-5 parts for optimal completion rates."
+        else:
+            series_strategy = "Consider creating more series content to engage your audience more deeply. Series posts tend to build reader loyalty and encourage return visits."
+
         # Check for optimal time data
-        best_days = []
-        best_hours = []
-        if 'best_days' in analysis_data and analysis_data['best_days']:
-            best_days = [day.get('day', '') for day in analysis_data['best_days'][:2]]
+        if days := analysis_data.get('best_days'):
+            best_days = [day.get('day', '') for day in days[:2]]
         else:
             best_days = ["Tuesday", "Thursday"]
-            
-        if 'best_hours' in analysis_data and analysis_data['best_hours']:
-            best_hours = [f"{hour.get('hour', '')}:00" for hour in analysis_data['best_hours'][:2]]
+
+        if hours := analysis_data.get('best_hours'):
+            best_hours = [f"{hour.get('hour', '')}:00" for hour in hours[:2]]
         else:
             best_hours = ["8:00", "12:00"]
             
-        # Check for tag recommendations
-        recommended_tags = top_tags
-        if 'tag_recommendations' in analysis_data and analysis_data['tag_recommendations']:
-            for rec in analysis_data['tag_recommendations']:
-                if rec.get('type') == 'top_performing' and 'tags' in rec:
-                    recommended_tags = rec['tags']
-                    break
-        
-        return {
-            "performance_summary": f"Your dev.to blog posts show good engagement with healthy reaction and comment rates. Your content in the {', '.join(top_tags)} tags performs particularly well. Your posts with practical, solution-oriented content receive higher engagement than more theoretical pieces.",
-            
-            "key_patterns": [
-                f"Tutorial-style posts with specific code examples typically get 40% more engagement",
-                f"Posts with 5-10 minute reading times perform better than both shorter and longer content",
-                f"Articles published on {' and '.join(best_days)} receive more reactions and comments",
-                f"Content tagged with '{', '.join(top_tags)}' consistently attracts more readers",
-                f"Posts that include diagrams or visual elements get 30% more reactions"
-            ],
-            
-            "content_recommendations": [
-                "Create more step-by-step tutorials with practical code examples",
-                "Break complex topics into series of 5-8 minute reading time posts",
-                "Include diagrams or visualizations to improve engagement on conceptual topics",
-                "End posts with a clear call-to-action like a question to increase comment rates",
-                "Add a personal perspective to technical content to differentiate your writing",
-                f"Use the tag combination '{top_tags[0]} + {top_tags[1] if len(top_tags) > 1 else 'react'}' for highest visibility"
-            ],
-            
-            "optimal_posting_strategy": {
-                "best_days": best_days,
-                "best_hours": best_hours,
-                "recommended_tags": recommended_tags,
-                "content_type": "In-depth tutorials with practical code examples and clear explanations of technical concepts",
-                "style_tips": "Aim for 5-8 minute reading time, use headings to break up content, include code samples, and end with thought-provoking questions to encourage comments"
-            },
-            
-            "series_strategy": series_strategy,
-            
-            "engagement_boosters": "Respond quickly to comments on your posts to foster community. Share your posts on Twitter and LinkedIn with thoughtful commentary. Consider cross-posting popular content to your personal blog with canonical URLs pointing to dev.to. Ask engaging questions at the end of your posts to encourage discussion."
+        # Check for tag recommendations, indexed by type for direct lookup
+        rec_by_type = {rec['type']: rec for rec in analysis_data.get('tag_recommendations') or [] if 'type' in rec}
+        rec = rec_by_type.get('top_performing')
+        recommended_tags = rec['tags'] if rec and 'tags' in rec else top_tags
+        
+        ctx = {
+            'top_tags_joined': ', '.join(top_tags),
+            'best_days_joined': ' and '.join(best_days),
+            'tag_combo': f"{top_tags[0]} + {top_tags[1] if len(top_tags) > 1 else 'react'}",
+            'best_days': best_days,
+            'best_hours': best_hours,
+            'recommended_tags': recommended_tags,
+            'series_strategy': series_strategy
         }
+        return _render_template(_INSIGHT_TEMPLATE, ctx)
     
     def _get_mock_topic_ideas(self, analysis_data: Dict[str, Any], num_ideas: int) -> List[Dict[str, Any]]:
         """
@@ -396,120 +670,87 @@ The title should:
         Returns:
             List of mock topic idea dictionaries
         """
-        # Get user's top performing tags with performance metrics and normalize them
-        top_tags = analysis_data.get('top_tags', [])
-        top_performing_tags = [self._normalize_tag(tag['tag']) for tag in top_tags][:5]
+        # Get user's top performing tags with performance metrics and normalize
+        # them; extracted once into an immutable tuple and reused throughout
+        top_tags = analysis_data.get('top_tags') or []
+        top_performing_tags = tuple(self._normalize_tag(tag['tag']) for tag in top_tags[:5])
         
-        # Get best tag combinations from performance data
+        # Get best tag combinations from performance data, tracked as two
+        # parallel maps instead of a dict-of-dicts per combo
         high_engagement_posts = analysis_data.get('highest_engagement_posts', [])
-        successful_tag_combos = {}
-        
+        combo_count = defaultdict(int)
+        combo_engagement = defaultdict(float)
+
         for post in high_engagement_posts:
-            tags = post.get('tags', '').split(',') if isinstance(post.get('tags'), str) else post.get('tags', [])
-            tags = [self._normalize_tag(tag.strip()) for tag in tags if tag.strip()]
+            tags = [self._normalize_tag(tag) for tag in _split_tags(post.get('tags'))]
             if len(tags) >= 2:
                 combo = tuple(sorted(tags))
-                if combo not in successful_tag_combos:
-                    successful_tag_combos[combo] = {
-                        'engagement': post.get('engagement_ratio', 0),
-                        'count': 1
-                    }
-                else:
-                    successful_tag_combos[combo]['count'] += 1
-                    successful_tag_combos[combo]['engagement'] = max(
-                        successful_tag_combos[combo]['engagement'],
-                        post.get('engagement_ratio', 0)
-                    )
-        
-        # Sort tag combinations by engagement and count
-        best_combos = sorted(
-            successful_tag_combos.items(),
-            key=lambda x: (x[1]['engagement'], x[1]['count']),
-            reverse=True
+                combo_count[combo] += 1
+                engagement = post.get('engagement_ratio', 0)
+                if engagement > combo_engagement[combo]:
+                    combo_engagement[combo] = engagement
+
+        # Only the single best combination is used, so a full sort is overkill
+        best_combos = heapq.nlargest(
+            1,
+            combo_count,
+            key=lambda combo: (combo_engagement[combo], combo_count[combo])
         )
-        
+
         # Check if user publishes series
         has_series = 'series_performance' in analysis_data and len(analysis_data.get('series_performance', [])) > 0
-        
-        # Generate ideas based on successful patterns
-        ideas = []
-        
-        # Idea 1: Tutorial combining top two tags
-        if len(top_performing_tags) >= 2:
-            ideas.append({
-                "title": self._generate_title("tutorial", [top_performing_tags[0], top_performing_tags[1]], analysis_data),
-                "description": f"A comprehensive guide combining {top_performing_tags[0]} and {top_performing_tags[1]} to build production-ready applications. Learn best practices, optimization techniques, and real-world implementation patterns.",
-                "suggested_tags": [top_performing_tags[0], top_performing_tags[1], self._normalize_tag("tutorial"), self._normalize_tag("programming")],
-                "estimated_reading_time": 8,
-                "performance_rationale": f"Combines your two best-performing tags ({top_performing_tags[0]}, {top_performing_tags[1]}) which have an average of {next((tag['avg_reactions'] for tag in top_tags if tag['tag'] == top_performing_tags[0].lower()), 0):.1f} reactions per post.",
-                "series_potential": "Would work well as a 3-part series" if has_series else "Standalone post"
-            })
-        
-        # Idea 2: Best practices based on top tag
-        if top_performing_tags:
-            ideas.append({
-                "title": self._generate_title("best-practices", [top_performing_tags[0]], analysis_data),
-                "description": f"Learn from real-world experience about common pitfalls in {top_performing_tags[0]} development. Includes code examples, performance tips, and maintainability guidelines.",
-                "suggested_tags": [top_performing_tags[0], self._normalize_tag("bestpractices"), self._normalize_tag("programming"), self._normalize_tag("debugging")],
-                "estimated_reading_time": 7,
-                "performance_rationale": f"Your content in {top_performing_tags[0]} consistently performs well with {next((tag['avg_reactions'] for tag in top_tags if tag['tag'] == top_performing_tags[0].lower()), 0):.1f} average reactions.",
-                "series_potential": "Standalone post"
-            })
-        
-        # Idea 3: Based on best performing tag combination
-        if best_combos:
-            best_combo = list(best_combos[0][0])
-            ideas.append({
-                "title": self._generate_title("tutorial", best_combo, analysis_data),
-                "description": f"Learn how to integrate {best_combo[0]} with {best_combo[1]} to create robust applications. Based on real-world best practices and performance optimization techniques.",
-                "suggested_tags": best_combo + [self._normalize_tag("tutorial"), self._normalize_tag("webdev")],
-                "estimated_reading_time": 9,
-                "performance_rationale": f"This tag combination has historically performed very well, with {best_combos[0][1]['engagement']:.3f} engagement ratio across {best_combos[0][1]['count']} posts.",
-                "series_potential": "Would work well as a 4-part series" if has_series else "Standalone post"
-            })
-        
-        # Idea 4: Testing and automation for top performing tag
-        if top_performing_tags:
-            ideas.append({
-                "title": self._generate_title("best-practices", [top_performing_tags[0], "testing"], analysis_data),
-                "description": f"A comprehensive guide to testing {top_performing_tags[0]} applications. Covers unit testing, integration testing, and setting up CI/CD pipelines.",
-                "suggested_tags": [top_performing_tags[0], self._normalize_tag("testing"), self._normalize_tag("automation"), self._normalize_tag("devops")],
-                "estimated_reading_time": 8,
-                "performance_rationale": f"Content about {top_performing_tags[0]} combined with testing/automation typically drives high engagement.",
-                "series_potential": "Would work well as a 3-part testing series" if has_series else "Standalone post"
-            })
-        
-        # Idea 5: Performance optimization with top tags
-        if len(top_performing_tags) >= 2:
-            ideas.append({
-                "title": self._generate_title("deep-dive", [top_performing_tags[0], top_performing_tags[1]], analysis_data),
-                "description": f"Deep dive into performance optimization for applications using {top_performing_tags[0]} and {top_performing_tags[1]}. Includes benchmarking, profiling, and practical optimization techniques.",
-                "suggested_tags": [top_performing_tags[0], top_performing_tags[1], self._normalize_tag("performance"), self._normalize_tag("optimization")],
-                "estimated_reading_time": 7,
-                "performance_rationale": f"Performance-focused content using your top tags ({top_performing_tags[0]}, {top_performing_tags[1]}) consistently drives high engagement.",
-                "series_potential": "Would work well as a performance optimization series" if has_series else "Standalone post"
-            })
-        
-        # Idea 6: Security topics with top tag
+
+        # Build the shared interpolation context once, then expand the idea
+        # templates in a single pass instead of constructing each idea inline
+        best_combo = list(best_combos[0]) if best_combos else []
+        ctx = {}
+        ctx_tags = {}
+        tag_reactions = {tag['tag']: tag.get('avg_reactions', 0) for tag in top_tags}
         if top_performing_tags:
-            ideas.append({
-                "title": self._generate_title("best-practices", [top_performing_tags[0], "security"], analysis_data),
-                "description": f"Essential security considerations and implementation techniques for {top_performing_tags[0]} applications. Covers common vulnerabilities, security testing, and secure coding practices.",
-                "suggested_tags": [top_performing_tags[0], self._normalize_tag("security"), self._normalize_tag("webdev"), self._normalize_tag("bestpractices")],
-                "estimated_reading_time": 8,
-                "performance_rationale": "Security topics consistently perform well across technical audiences, especially when combined with specific technology implementations.",
-                "series_potential": "Would work well as a security series" if has_series else "Standalone post"
-            })
-        
-        # Idea 7: Architecture patterns with best performing tags
+            ctx_tags['top0'] = ctx['top0'] = top_performing_tags[0]
+            ctx['top0_reactions'] = tag_reactions.get(top_performing_tags[0].lower(), 0)
         if len(top_performing_tags) >= 2:
+            ctx_tags['top1'] = ctx['top1'] = top_performing_tags[1]
+        if best_combo:
+            ctx['combo0'] = best_combo[0]
+            ctx['combo1'] = best_combo[1]
+            ctx['combo_engagement'] = combo_engagement[best_combos[0]]
+            ctx['combo_count'] = combo_count[best_combos[0]]
+
+        series_potentials = _SERIES_POTENTIALS if has_series else _STANDALONE_POTENTIALS
+
+        ideas = []
+        for index, template in enumerate(_IDEA_TEMPLATES):
+            if len(ideas) == num_ideas:
+                break
+            if template['requires'] == 'combo':
+                if not best_combo:
+                    continue
+            elif len(top_performing_tags) < template['requires']:
+                continue
+
+            title_tags = []
+            for entry in template['title_tags']:
+                if entry == '+combo':
+                    title_tags.extend(best_combo)
+                else:
+                    title_tags.append(ctx_tags.get(entry, entry))
+
+            suggested_tags = []
+            for entry in template['suggested_tags']:
+                if entry == '+combo':
+                    suggested_tags.extend(best_combo)
+                else:
+                    # Literal template tags are pre-normalized at import time
+                    suggested_tags.append(ctx_tags.get(entry, entry))
+
             ideas.append({
-                "title": self._generate_title("deep-dive", [top_performing_tags[0], top_performing_tags[1]], analysis_data),
-                "description": f"Explore modern software architecture patterns using {top_performing_tags[0]} and {top_performing_tags[1]}. Learn about microservices, serverless, and scalable architectures.",
-                "suggested_tags": [top_performing_tags[0], top_performing_tags[1], self._normalize_tag("architecture"), self._normalize_tag("design-patterns")],
-                "estimated_reading_time": 9,
-                "performance_rationale": "Architecture-focused content tends to drive high engagement, especially when combined with practical implementation using top-performing technologies.",
-                "series_potential": "Would work well as a 5-part architecture series" if has_series else "Standalone post"
+                "title": self._generate_title(template['pattern'], title_tags, analysis_data),
+                "description": template['description'].format_map(ctx),
+                "suggested_tags": suggested_tags,
+                "estimated_reading_time": template['reading_time'],
+                "performance_rationale": template['rationale'].format_map(ctx),
+                "series_potential": series_potentials[index]
             })
-        
-        return ideas[:num_ideas]
\ No newline at end of file
+
+        return ideas
\ No newline at end of file